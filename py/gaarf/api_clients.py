@@ -39,6 +39,8 @@ google_ads_service = importlib.import_module(
   'services.types.google_ads_service'
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclasses.dataclass(frozen=True)
 class FieldPossibleValues:
@@ -362,10 +364,11 @@ class GoogleAdsApiClient(BaseClient):
       Instantiated GoogleAdsApiClient.
     """
     if use_proto_plus != ads_client.use_proto_plus:
-      logging.warning(
+      logger.warning(
         'Mismatch between values of "use_proto_plus" in '
         'GoogleAdsClient and GoogleAdsApiClient, setting '
-        f'"use_proto_plus={use_proto_plus}"'
+        '"use_proto_plus=%s"',
+        use_proto_plus,
       )
     return cls(
       ads_client=ads_client,
@@ -86,23 +86,22 @@ def main():
     with futures.ThreadPoolExecutor(
       max_workers=main_args.parallel_threshold
     ) as executor:
-      future_to_query = {
-        executor.submit(
+      for query in sorted(main_args.query):
+        callback = functools.partial(
           bigquery_executor.execute,
           query,
           reader_client.read(query),
           config.params,
-        ): query
-        for query in sorted(main_args.query)
-      }
-      for future in futures.as_completed(future_to_query):
-        query = future_to_query[future]
-        utils.postprocessor_runner(query, future.result, logger)
+        )
+        executor.submit(utils.postprocessor_runner, query, callback, logger)
   else:
     logger.info('Running queries sequentially')
     for query in sorted(main_args.query):
       callback = functools.partial(
-        executor.execute, query, reader_client.read(query), config.params
+        bigquery_executor.execute,
+        query,
+        reader_client.read(query),
+        config.params,
       )
       utils.postprocessor_runner(query, callback, logger)
 
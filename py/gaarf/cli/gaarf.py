@@ -78,6 +78,12 @@ def main():
   parser.add_argument(
     '--parallel-threshold', dest='parallel_threshold', default=None, type=int
   )
+  parser.add_argument(
+    '--max-customer-concurrency',
+    dest='max_customer_concurrency',
+    default=None,
+    type=int,
+  )
   parser.set_defaults(save_config=False)
   parser.set_defaults(parallel_queries=True)
   parser.set_defaults(dry_run=False)
@@ -180,8 +186,8 @@ def main():
   if main_args.parallel_queries:
     logger.info('Running queries in parallel')
     with futures.ThreadPoolExecutor(main_args.parallel_threshold) as executor:
-      future_to_query = {
-        executor.submit(
+      for query in main_args.query:
+        callback = functools.partial(
           ads_query_executor.execute,
           reader_client.read(query),
           query,
@@ -189,12 +195,9 @@ def main():
           writer_client,
           config.params,
           main_args.optimize_performance,
-        ): query
-        for query in main_args.query
-      }
-      for future in futures.as_completed(future_to_query):
-        query = future_to_query[future]
-        utils.gaarf_runner(query, future.result, logger)
+          main_args.max_customer_concurrency,
+        )
+        executor.submit(utils.gaarf_runner, query, callback, logger)
   else:
     logger.info('Running queries sequentially')
     for query in main_args.query:
@@ -206,6 +209,7 @@ def main():
         writer_client,
         config.params,
         main_args.optimize_performance,
+        main_args.max_customer_concurrency,
       )
       utils.gaarf_runner(query, callback, logger)
 
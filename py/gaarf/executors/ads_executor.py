@@ -20,6 +20,7 @@ GaarfReport and saving it to local/remote storage.
 
 from __future__ import annotations
 
+import functools
 import logging
 from collections.abc import MutableSequence
 
@@ -50,9 +51,13 @@ class AdsQueryExecutor:
     """
     self.api_client = api_client
 
-  @property
+  @functools.cached_property
   def report_fetcher(self) -> report_fetcher.AdsReportFetcher:
-    """Initializes AdsReportFetcher to get data from Ads API."""
+    """Initializes AdsReportFetcher to get data from Ads API.
+
+    Fetcher is created only once so that all queries share the same
+    GoogleAdsService client and its underlying gRPC channel.
+    """
     return report_fetcher.AdsReportFetcher(self.api_client)
 
   async def aexecute(
@@ -63,6 +68,7 @@ class AdsQueryExecutor:
     writer_client: abs_writer.AbsWriter = console_writer.ConsoleWriter(),
     args: dict[str, str] | None = None,
     optimize_performance: str = 'NONE',
+    max_customer_concurrency: int | None = None,
   ) -> None:
     """Reads query, extract results and stores them in a specified location.
 
@@ -75,6 +81,8 @@ class AdsQueryExecutor:
         args: Arguments that need to be passed to the query.
         optimize_performance: strategy for speeding up query execution
             ("NONE", "PROTOBUF", "BATCH", "BATCH_PROTOBUF").
+        max_customer_concurrency: Maximum number of accounts fetched
+            concurrently; accounts are fetched one by one if not set.
     """
     self.execute(
       query_text,
@@ -83,6 +91,7 @@ class AdsQueryExecutor:
       writer_client,
       args,
       optimize_performance,
+      max_customer_concurrency,
     )
 
   def execute(
@@ -93,6 +102,7 @@ class AdsQueryExecutor:
     writer_client: abs_writer.AbsWriter = console_writer.ConsoleWriter(),
     args: dict[str, str] | None = None,
     optimize_performance: str = 'NONE',
+    max_customer_concurrency: int | None = None,
   ) -> None:
     """Reads query, extract results and stores them in a specified location.
 
@@ -105,6 +115,8 @@ class AdsQueryExecutor:
         args: Arguments that need to be passed to the query.
         optimize_performance: strategy for speeding up query execution
             ("NONE", "PROTOBUF", "BATCH", "BATCH_PROTOBUF").
+        max_customer_concurrency: Maximum number of accounts fetched
+            concurrently; accounts are fetched one by one if not set.
     """
     query_specification = query_editor.QuerySpecification(
       query_text, query_name, args, self.report_fetcher.api_client.api_version
@@ -113,6 +125,7 @@ class AdsQueryExecutor:
       query_specification=query_specification,
       customer_ids=customer_ids,
       optimize_strategy=optimize_performance,
+      max_customer_concurrency=max_customer_concurrency,
     )
     logger.debug(
       'Start writing data for query %s via %s writer',
@@ -23,6 +23,7 @@ except ImportError as e:
     '- `pip install google-ads-api-report-fetcher[bq]`'
   ) from e
 
+import functools
 import logging
 
 import pandas as pd
@@ -56,9 +57,9 @@ class BigQueryExecutor(query_post_processor.PostProcessorMixin):
     self.project_id = project_id
     self.location = location
 
-  @property
+  @functools.cached_property
   def client(self) -> bigquery.Client:
-    """Instantiates bigquery client."""
+    """Instantiates bigquery client shared by all executed queries."""
     return bigquery.Client(self.project_id)
 
   def execute(
@@ -31,6 +31,10 @@ import pandas as pd
 
 from gaarf import query_post_processor
 
+logger = logging.getLogger(__name__)
+
+_CREATE_OR_UPDATE_STATEMENT = re.compile(r'(create|update) ', re.IGNORECASE)
+
 
 class SqlAlchemyQueryExecutor(query_post_processor.PostProcessorMixin):
   """Handles query execution via SqlAlchemy.
@@ -63,10 +67,10 @@ class SqlAlchemyQueryExecutor(query_post_processor.PostProcessorMixin):
     Returns:
         DataFrame if query returns some data otherwise empty DataFrame.
     """
-    logging.info('Executing script: %s', script_name)
+    logger.info('Executing script: %s', script_name)
     query_text = self.replace_params_template(query_text, params)
     with self.engine.begin() as conn:
-      if re.findall(r'(create|update) ', query_text.lower()):
+      if _CREATE_OR_UPDATE_STATEMENT.search(query_text):
         conn.connection.executescript(query_text)
         return pd.DataFrame()
       temp_table_name = f'temp_{script_name}'.replace('.', '_')
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from enum import Enum
 from pathlib import Path
 from typing import Callable, Union, get_args
@@ -89,6 +90,20 @@ class ArrayHandlingStrategy(FormattingStrategy):
       results_placeholder=formatted_placeholders,
     )
 
+  def iter_formatted_rows(self, rows: Iterable[list]) -> Iterator[list]:
+    """Lazily replaces arrays in rows without building a new report.
+
+    Args:
+        rows: Rows on GaarfReport.
+
+    Yields:
+        Formatted rows.
+    """
+    if self.type_ == ArrayHandling.ARRAYS:
+      yield from rows
+      return
+    yield from self._iter_rows(rows, self._delimiter_join)
+
   def _format_rows(
     self, rows: list[list], nested_field_handler: Callable
   ) -> list[list]:
@@ -101,15 +116,28 @@ class ArrayHandlingStrategy(FormattingStrategy):
     Returns:
         Formatted rows.
     """
-    formatted_rows = []
+    return list(self._iter_rows(rows, nested_field_handler))
+
+  def _iter_rows(
+    self, rows: Iterable[list], nested_field_handler: Callable
+  ) -> Iterator[list]:
+    """Formats rows of report one by one based on join_strategy.
+
+    Args:
+        rows: Rows on GaarfReport.
+        nested_field_handler: Handlers to nested structures.
+
+    Yields:
+        Formatted row.
+    """
+    nested_types = get_args(_NESTED_FIELD)
     for row in rows:
-      formatted_row = []
-      for field in row:
-        if isinstance(field, get_args(_NESTED_FIELD)):
-          field = nested_field_handler(field)
-        formatted_row.append(field)
-      formatted_rows.append(formatted_row)
-    return formatted_rows
+      yield [
+        nested_field_handler(field)
+        if isinstance(field, nested_types)
+        else field
+        for field in row
+      ]
 
   def _delimiter_join(self, field: _NESTED_FIELD) -> str:
     """Helper function to perform join by an instance delimiter.
@@ -120,7 +148,7 @@ class ArrayHandlingStrategy(FormattingStrategy):
     Returns:
         The same field but concatenated to string.
     """
-    return self.delimiter.join([str(element) for element in field])
+    return self.delimiter.join(map(str, field))
 
 
 def format_report_for_writing(
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import abc
 import logging
+from collections.abc import Iterator
 from typing import Literal
 
 import proto  # type: ignore
@@ -48,3 +49,10 @@ class AbsWriter(abc.ABC):
     return formatter.format_report_for_writing(
       report, [array_handling_strategy]
     )
+
+  def iter_rows_for_write(self, report: GaarfReport) -> Iterator[list]:
+    """Yields formatted rows of report without copying the whole report."""
+    array_handling_strategy = formatter.ArrayHandlingStrategy(
+      type_=self.array_handling, delimiter=self.array_separator
+    )
+    return array_handling_strategy.iter_formatted_rows(report.results)
@@ -24,6 +24,7 @@ except ImportError as e:
   ) from e
 
 import datetime
+import functools
 import logging
 from collections.abc import Sequence
 
@@ -37,6 +38,20 @@ from gaarf import parsers
 from gaarf.io import formatter
 from gaarf.io.writers import abs_writer
 
+logger = logging.getLogger(__name__)
+
+_BIGQUERY_FIELD_TYPES = {
+  list: 'REPEATED',
+  str: 'STRING',
+  datetime.datetime: 'DATETIME',
+  datetime.date: 'DATE',
+  int: 'INT64',
+  float: 'FLOAT64',
+  bool: 'BOOL',
+  proto.marshal.collections.repeated.RepeatedComposite: 'REPEATED',
+  proto.marshal.collections.repeated.Repeated: 'REPEATED',
+}
+
 
 class BigQueryWriter(abs_writer.AbsWriter):
   """Writes Gaarf Report to BigQuery.
@@ -74,9 +89,9 @@ class BigQueryWriter(abs_writer.AbsWriter):
   def __str__(self) -> str:
     return f'[BigQuery] - {self.dataset_id} at {self.location} location.'
 
-  @property
+  @functools.cached_property
   def client(self) -> bigquery.Client:
-    """Instantiated BigQuery client."""
+    """Instantiated BigQuery client shared by all writes."""
     return bigquery.Client(self.project)
 
   def create_or_get_dataset(self) -> bigquery.Dataset:
@@ -119,13 +134,13 @@ class BigQueryWriter(abs_writer.AbsWriter):
     else:
       df = report.to_pandas()
     df = df.replace({np.nan: None})
-    logging.debug('Writing %d rows of data to %s', len(df), destination)
+    logger.debug('Writing %d rows of data to %s', len(df), destination)
     job = self.client.load_table_from_dataframe(
       dataframe=df, destination=table, job_config=job_config
     )
     try:
       job.result()
-      logging.debug('Writing to %s is completed', destination)
+      logger.debug('Writing to %s is completed', destination)
     except google_cloud_exceptions.BadRequest as e:
       raise ValueError(f'Unable to save data to BigQuery! {str(e)}') from e
     return f'[BigQuery] - at {self.dataset_id}.{destination}'
@@ -220,26 +235,13 @@ def _get_bq_schema(
   Returns:
      BigQuery schema fields corresponding to GaarfReport.
   """
-  type_mapping = {
-    list: 'REPEATED',
-    str: 'STRING',
-    datetime.datetime: 'DATETIME',
-    datetime.date: 'DATE',
-    int: 'INT64',
-    float: 'FLOAT64',
-    bool: 'BOOL',
-    proto.marshal.collections.repeated.RepeatedComposite: 'REPEATED',
-    proto.marshal.collections.repeated.Repeated: 'REPEATED',
-  }
-
   schema: list[bigquery.SchemaField] = []
   for key, value in types.items():
-    field_type = type_mapping.get(value.get('field_type'))
     schema.append(
       bigquery.SchemaField(
         name=key,
-        field_type=field_type if field_type else 'STRING',
-        mode='REPEATED' if value.get('repeated') else 'NULLABLE',
+        field_type=_BIGQUERY_FIELD_TYPES.get(value['field_type'], 'STRING'),
+        mode='REPEATED' if value['repeated'] else 'NULLABLE',
       )
     )
   return schema
@@ -28,6 +28,8 @@ from gaarf.io import formatter
 from gaarf.io.writers import file_writer
 from gaarf.report import GaarfReport
 
+logger = logging.getLogger(__name__)
+
 
 class CsvWriter(file_writer.FileWriter):
   """Writes Gaarf Report to CSV.
@@ -77,10 +79,9 @@ class CsvWriter(file_writer.FileWriter):
     Returns:
         Full path where data are written.
     """
-    report = self.format_for_write(report)
     destination = formatter.format_extension(destination, new_extension='.csv')
     self.create_dir()
-    logging.debug('Writing %d rows of data to %s', len(report), destination)
+    logger.debug('Writing %d rows of data to %s', len(report), destination)
     output_path = os.path.join(self.destination_folder, destination)
     with smart_open.open(
       output_path,
@@ -94,6 +95,6 @@ class CsvWriter(file_writer.FileWriter):
         quoting=self.quoting,
       )
       writer.writerow(report.column_names)
-      writer.writerows(report.results)
-    logging.debug('Writing to %s is completed', output_path)
+      writer.writerows(self.iter_rows_for_write(report))
+    logger.debug('Writing to %s is completed', output_path)
     return f'[CSV] - at {output_path}'
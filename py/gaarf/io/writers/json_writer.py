@@ -28,6 +28,8 @@ import gaarf
 from gaarf.io import formatter
 from gaarf.io.writers import file_writer
 
+logger = logging.getLogger(__name__)
+
 
 class JsonWriter(file_writer.FileWriter):
   """Writes Gaarf Report to JSON.
@@ -62,9 +64,9 @@ class JsonWriter(file_writer.FileWriter):
     report = self.format_for_write(report)
     destination = formatter.format_extension(destination, new_extension='.json')
     self.create_dir()
-    logging.debug('Writing %d rows of data to %s', len(report), destination)
+    logger.debug('Writing %d rows of data to %s', len(report), destination)
     output_path = os.path.join(self.destination_folder, destination)
     with smart_open.open(output_path, 'w', encoding='utf-8') as f:
       json.dump(report.to_list(row_type='dict'), f)
-    logging.debug('Writing to %s is completed', output_path)
+    logger.debug('Writing to %s is completed', output_path)
     return f'[JSON] - at {output_path}'
@@ -32,6 +32,8 @@ from gaarf.io import formatter
 from gaarf.io.writers.abs_writer import AbsWriter
 from gaarf.report import GaarfReport
 
+logger = logging.getLogger(__name__)
+
 
 class SheetWriter(AbsWriter):
   def __init__(
@@ -87,7 +89,7 @@ class SheetWriter(AbsWriter):
       sheet.append_rows(report.results, value_input_option='RAW')
 
     success_msg = f'Report is saved to {sheet.url}'
-    logging.info(success_msg)
+    logger.info(success_msg)
     if self.share_with:
       self.spreadsheet.share(self.share_with, perm_type='user', role='writer')
     return success_msg
@@ -31,6 +31,8 @@ from gaarf import report as gaarf_report
 from gaarf.io import formatter
 from gaarf.io.writers import abs_writer
 
+logger = logging.getLogger(__name__)
+
 
 class SqlAlchemyWriter(abs_writer.AbsWriter):
   """Handles writing GaarfReports data to databases supported by SqlAlchemy.
@@ -71,11 +73,11 @@ class SqlAlchemyWriter(abs_writer.AbsWriter):
       ).head(0)
     else:
       df = report.to_pandas()
-    logging.debug('Writing %d rows of data to %s', len(df), destination)
+    logger.debug('Writing %d rows of data to %s', len(df), destination)
     df.to_sql(
       name=destination, con=self.engine, index=False, if_exists=self.if_exists
     )
-    logging.debug('Writing to %s is completed', destination)
+    logger.debug('Writing to %s is completed', destination)
 
   @property
   def engine(self) -> sqlalchemy.engine.Engine:
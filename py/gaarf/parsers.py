@@ -21,10 +21,11 @@ from __future__ import annotations
 
 import ast
 import contextlib
+import functools
 import importlib
 import operator
-import re
 from collections import abc
+from collections.abc import Callable, Iterable
 from typing import Union, get_args
 
 import proto  # type: ignore
@@ -56,6 +57,9 @@ _NESTED_FIELD: TypeAlias = Union[
   _REPEATED_COMPOSITE,
 ]
 
+# Elements of these exact types are returned unchanged by the parsers chain.
+_SCALAR_TYPES = frozenset((int, float, str, bool, type(None)))
+
 
 class BaseParser:
   """Base class for defining parsers.
@@ -207,6 +211,13 @@ class GoogleAdsRowParser:
     self.column_names = query_specification.column_names
     self.parser_chain = self._init_parsers_chain()
     self.row_getter = operator.attrgetter(*query_specification.fields)
+    # Resolve once which columns are virtual and which customizer applies
+    # to each column so that row parsing does not need to perform these
+    # lookups for each column of each row.
+    self._column_plan = [
+      (self.virtual_columns.get(column), self._init_customizer(column))
+      for column in self.column_names
+    ]
     # Some segments are automatically converted to 0 when not present
     # For this case we specify attribute `respect_null` which converts
     # such attributes to None rather than 0
@@ -227,6 +238,26 @@ class GoogleAdsRowParser:
       parser_chain = new_parser
     return parser_chain
 
+  def _init_customizer(
+    self, column: str
+  ) -> Callable[[GoogleAdsRowElement], GoogleAdsRowElement] | None:
+    """Builds function that applies customizer to the column, if any.
+
+    Args:
+        column: Name of the column.
+
+    Returns:
+        Function that extracts customized value from row element or None
+        if column does not have a customizer.
+    """
+    if not self.customizers or not (caller := self.customizers.get(column)):
+      return None
+    if caller.get('type') == 'nested_field':
+      return self._init_nested_customizer(caller)
+    if caller.get('type') == 'resource_index':
+      return functools.partial(self._get_resource_index, caller=caller)
+    return None
+
   def parse_ads_row(
     self, row: google_ads_service.GoogleAdsRow
   ) -> list[GoogleAdsRowElement]:
@@ -239,126 +270,104 @@ class GoogleAdsRowParser:
         List of parsed elements.
     """
     parsed_row_elements: list[GoogleAdsRowElement] = []
-    extracted_attributes = self._get_attributes_from_row(row, self.row_getter)
-    index = 0
-    for column in self.column_names:
-      if column in self.virtual_columns.keys():
-        parsed_element = self._convert_virtual_column(
-          row, self.virtual_columns[column]
-        )
+    extracted_attributes = iter(
+      self._get_attributes_from_row(row, self.row_getter)
+    )
+    for virtual_column, customizer in self._column_plan:
+      if virtual_column is not None:
+        parsed_element = self._convert_virtual_column(row, virtual_column)
       else:
-        parsed_element = self._parse_row_element(
-          extracted_attributes[index], column
-        )
-        index += 1
+        extracted_attribute = next(extracted_attributes)
+        if customizer is not None:
+          extracted_attribute = customizer(extracted_attribute)
+        parsed_element = self._parse_element(extracted_attribute)
       parsed_row_elements.append(parsed_element)
     return parsed_row_elements
 
-  def _parse_row_element(
-    self, extracted_attribute: GoogleAdsRowElement, column: str
-  ) -> GoogleAdsRowElement:
-    """Parses a single element from row.
+  def parse_ads_rows(
+    self, rows: Iterable[google_ads_service.GoogleAdsRow]
+  ) -> list[list[GoogleAdsRowElement]]:
+    """Parses a batch of GoogleAdsRow.
 
     Args:
-        extracted_attribute: A single element from GoogleAdsRow.
-        column: Corresponding name of the element.
+        rows: GoogleAdsRows from a single batch of Ads API response.
 
     Returns:
-        Parsed element.
+        List of parsed elements for each row.
     """
-    if self.customizers:
-      extracted_attribute = self._extract_attributes_with_customizer(
-        extracted_attribute, column
-      )
-    if isinstance(extracted_attribute, abc.MutableSequence):
-      parsed_element = [
-        self.parser_chain.parse(element) or element
-        for element in extracted_attribute
-      ]
-    else:
-      parsed_element = (
-        self.parser_chain.parse(extracted_attribute) or extracted_attribute
-      )
-
-    return parsed_element
+    parse_ads_row = self.parse_ads_row
+    return [parse_ads_row(row) for row in rows]
 
-  def _extract_attributes_with_customizer(
-    self, extracted_attribute: GoogleAdsRowElement, column: str
+  def _parse_element(
+    self, extracted_attribute: GoogleAdsRowElement
   ) -> GoogleAdsRowElement:
-    """Extracts additional info from row element based on customizers.
-
-    Some GoogleAdsRow objects can be complex and customizers help extract
-    specific values from them by using special syntax.
+    """Applies chain of parsers to a single (possibly repeated) element.
 
     Args:
         extracted_attribute: A single element from GoogleAdsRow.
-        column: Corresponding name of the element.
 
     Returns:
-        Extracted row attribute.
+        Parsed element.
     """
-    if caller := self.customizers.get(column):
-      if caller.get('type') == 'nested_field':
-        extracted_attribute = self._extract_nested_customizer(
-          extracted_attribute, caller
-        )
-      elif caller.get('type') == 'resource_index':
-        extracted_attribute = self._get_resource_index(
-          extracted_attribute, caller
-        )
-    return extracted_attribute
+    if type(extracted_attribute) in _SCALAR_TYPES:
+      return extracted_attribute
+    parse = self.parser_chain.parse
+    if isinstance(extracted_attribute, abc.MutableSequence):
+      return [
+        element if type(element) in _SCALAR_TYPES else parse(element) or element
+        for element in extracted_attribute
+      ]
+    return parse(extracted_attribute) or extracted_attribute
 
-  def _extract_nested_customizer(
-    self, extracted_attribute, caller: dict[str, str]
-  ) -> GoogleAdsRowElement:
-    """Extracts additional info from nested resource.
+  def _init_nested_customizer(
+    self, caller: dict[str, str]
+  ) -> Callable[[GoogleAdsRowElement], GoogleAdsRowElement]:
+    """Builds function that extracts additional info from nested resource.
 
     Some GoogleAdsRow objects are nested and has attributes that can be
-    further accessed using special customizer syntax.
+    further accessed using special customizer syntax. Customizer value is
+    parsed and attribute getters are created only once per column.
 
     Args:
-        extracted_attribute: A single element from GoogleAdsRow.
         caller: Mapping between type of customizer type and its value.
 
     Returns:
-        Extracted row attribute.
-
-    Raises:
-        GaarfCustomizerException: When customizer incorrectly specified.
+        Function that extracts nested attribute from a row element.
     """
-    values_ = caller.get('value').split('.')
-    extracted_attribute_ = (
-      getattr(extracted_attribute, values_[0])
-      if hasattr(extracted_attribute, values_[0])
-      else extracted_attribute
+    customizer_value = caller.get('value')
+    values_ = customizer_value.split('.')
+    nested_resource = values_[0]
+    element_getter = operator.attrgetter(
+      values_[1] if len(values_) > 1 else customizer_value
     )
-    try:
-      if isinstance(extracted_attribute, get_args(_NESTED_FIELD)) or isinstance(
-        extracted_attribute_, get_args(_NESTED_FIELD)
-      ):
-        if isinstance(
-          extracted_attribute_, (repeated.Repeated, repeated.RepeatedComposite)
+    attribute_getter = operator.attrgetter(customizer_value)
+    nested_types = get_args(_NESTED_FIELD)
+
+    def extract_nested_customizer(
+      extracted_attribute: GoogleAdsRowElement,
+    ) -> GoogleAdsRowElement:
+      """Extracts nested attribute from a single element of GoogleAdsRow.
+
+      Raises:
+          GaarfCustomizerException: When customizer incorrectly specified.
+      """
+      extracted_attribute_ = getattr(
+        extracted_attribute, nested_resource, extracted_attribute
+      )
+      try:
+        if isinstance(extracted_attribute, nested_types) or isinstance(
+          extracted_attribute_, nested_types
         ):
-          extracted_attribute = extracted_attribute
-        if len(values_) > 1:
-          value = values_[1]
-        else:
-          value = caller.get('value')
-        extracted_attribute = list(
-          {
-            operator.attrgetter(value)(element)
-            for element in extracted_attribute_
-          }
+          return list(
+            {element_getter(element) for element in extracted_attribute_}
+          )
+        return attribute_getter(extracted_attribute)
+      except AttributeError as e:
+        raise exceptions.GaarfCustomizerException(
+          f'customizer "{caller}" is incorrect,\n' f'details: "{e}"'
         )
-      else:
-        extracted_attribute = operator.attrgetter(caller.get('value'))(
-          extracted_attribute
-        )
-      return extracted_attribute
-    except AttributeError as e:
-      raise exceptions.GaarfCustomizerException(
-        f'customizer "{caller}" is incorrect,\n' f'details: "{e}"'
-      )
+
+    return extract_nested_customizer
 
   def _get_resource_index(
     self, extracted_attribute: GoogleAdsRowElement, caller: dict[str, str]
@@ -386,10 +395,8 @@ class GoogleAdsRowParser:
         self._get_resource_index(attribute, caller)
         for attribute in parsed_element
       ]
-    extracted_attribute = re.split('~', extracted_attribute)[
-      caller.get('value')
-    ]
-    result = re.split('/', extracted_attribute)[-1]
+    extracted_attribute = extracted_attribute.split('~')[caller.get('value')]
+    result = extracted_attribute.rsplit('/', maxsplit=1)[-1]
     try:
       return int(result)
     except ValueError:
@@ -423,8 +430,6 @@ class GoogleAdsRowParser:
         ] = None
         # Convert back to tuple
         attributes = tuple(attributes)
-    else:
-      attributes = getter(row)
     return attributes if isinstance(attributes, tuple) else (attributes,)
 
   def _convert_virtual_column(
@@ -490,7 +495,7 @@ class ResourceFormatter:
 
   def get_nested_resource(self) -> Self:
     """Extract nested resources from the API response field."""
-    self.element = re.split(': ', self.element)[1]
+    self.element = self.element.split(': ')[1]
     return self
 
   def get_resource_id(self) -> Self:
@@ -499,12 +504,12 @@ class ResourceFormatter:
     Resource name looks like `customer/123/campaigns/321`.
     `get_resource_id` returns `321`.
     """
-    self.element = re.split('/', self.element)[-1]
+    self.element = self.element.rsplit('/', maxsplit=1)[-1]
     return self
 
   def clean_resource_id(self) -> Self:
     """Ensures that resource_id is cleaned up and converted to int."""
-    self.element = re.sub('"', '', self.element)
+    self.element = self.element.replace('"', '')
     with contextlib.suppress(ValueError):
       self.element = int(self.element)
     return self
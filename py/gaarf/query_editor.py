@@ -19,6 +19,7 @@ import ast
 import contextlib
 import dataclasses
 import datetime
+import functools
 import operator
 import re
 from typing import Generator
@@ -35,6 +36,33 @@ VALID_VIRTUAL_COLUMN_OPERATORS = (
   ast.Expression,
 )
 
+_WHITESPACES = re.compile(r'\s+')
+_COMMENTED_LINE = re.compile('^(#|--|//)')
+_INLINE_COMMENT = re.compile('(--|//).*$')
+_RESOURCE_NAME = re.compile(r'FROM\s+([\w.]+)', flags=re.IGNORECASE)
+_SELECT_OR_FROM_STATEMENT = re.compile(
+  r'\bSELECT\b|FROM .*', flags=re.IGNORECASE
+)
+_FILTERS = re.compile(
+  ' (WHERE|LIMIT|ORDER BY|PARAMETERS) .+', flags=re.IGNORECASE
+)
+_ALIAS = re.compile(' [Aa][Ss] ')
+_VIRTUAL_COLUMN_OPERATORS = re.compile(r'/|\*|\+| - ')
+_TYPE_FIELD = re.compile(r'\.type')
+_FORMATTED_TYPE_FIELD = re.compile(r'\.type_')
+_TRAILING_COMMA = re.compile(r',\s+from', flags=re.IGNORECASE)
+_REMOVE_QUOTES = str.maketrans('', '', '\'"')
+_DOTS_TO_UNDERSCORES = str.maketrans('.', '_')
+_CUSTOMIZER = re.compile(
+  r'(?P<field>[^~:>]+?)(?P<delimiter>~|->|:)(?P<value>[^~:>]+)'
+)
+_CUSTOMIZER_DELIMITER = re.compile('~|->|:')
+_CUSTOMIZER_TYPES = {
+  '~': 'resource_index',
+  ':': 'nested_field',
+  '->': 'pointer',
+}
+
 
 @dataclasses.dataclass(frozen=True)
 class VirtualColumn:
@@ -168,25 +196,32 @@ class QuerySpecification(
     self.args = args or {}
     self._api_version = api_version
 
-  @property
+  @functools.cached_property
   def base_client(self):
     """Helper for validating identified query fields."""
     return api_clients.BaseClient(self._api_version)
 
-  @property
+  @functools.cached_property
   def macros(self) -> dict[str, str]:
-    """Returns macros with injected common parameters."""
+    """Returns macros with injected common parameters.
+
+    Macros are resolved once per instance so that every occurrence of
+    a common parameter (i.e. current_datetime) gets the same value.
+    """
     common_params = dict(self.common_params)
     if macros := self.args.get('macro'):
       common_params.update(macros)
     return common_params
 
-  @property
+  @functools.cached_property
   def expanded_query(self) -> str:
-    """Applies necessary transformations to query."""
+    """Applies necessary transformations to query.
+
+    Query is expanded once per instance so that all query elements
+    are extracted from the same text.
+    """
     query_text = self.expand_jinja(self.text, self.args.get('template'))
-    query_lines = self._remove_comments_from_query(query_text)
-    query_text = ' '.join(query_lines)
+    query_text = ' '.join(self._remove_comments_from_query(query_text))
     try:
       return query_text.format(**self.macros).strip()
     except KeyError as e:
@@ -287,19 +322,23 @@ class QuerySpecification(
     )
     query_text = self._remove_trailing_comma(query_text)
     query_text = self._unformat_type_field_name(query_text)
-    return re.sub(r'\s+', ' ', query_text).strip()
+    return _WHITESPACES.sub(' ', query_text).strip()
+
+  def _remove_comments_from_query(
+    self, query_text: str
+  ) -> Generator[str, None, None]:
+    """Removes comments and converts text to lines.
 
-  def _remove_comments_from_query(self, query_text: str) -> list[str]:
-    """Removes comments and converts text to lines."""
-    result: list[str] = []
+    Yields:
+      Line in query without comments and trailing semicolon.
+    """
     for line in query_text.split('\n'):
-      if re.match('^(#|--|//)', line):
+      if _COMMENTED_LINE.match(line):
         continue
-      cleaned_query_line = re.sub(
-        ';$', '', re.sub('(--|//).*$', '', line).strip()
-      )
-      result.append(cleaned_query_line)
-    return result
+      cleaned_query_line = _INLINE_COMMENT.sub('', line).strip()
+      if cleaned_query_line.endswith(';'):
+        cleaned_query_line = cleaned_query_line[:-1]
+      yield cleaned_query_line
 
   def _extract_resource_from_query(self) -> str:
     """Finds resource_name in query_text.
@@ -310,10 +349,8 @@ class QuerySpecification(
     Raises:
       GaarfResourceException: If resource_name isn't found.
     """
-    if resource_name := re.findall(
-      r'FROM\s+([\w.]+)', self.expanded_query, flags=re.IGNORECASE
-    ):
-      return str(resource_name[0]).strip()
+    if resource_name := _RESOURCE_NAME.search(self.expanded_query):
+      return resource_name.group(1)
     raise exceptions.GaarfResourceException(
       f'No resource found in query: {self.expanded_query}'
     )
@@ -324,19 +361,15 @@ class QuerySpecification(
     Yields:
       Line in query between SELECT and FROM statements.
     """
-    selected_rows = re.sub(
-      r'\bSELECT\b|FROM .*', '', self.expanded_query, flags=re.IGNORECASE
+    selected_rows = _SELECT_OR_FROM_STATEMENT.sub(
+      '', self.expanded_query
     ).split(',')
     for row in selected_rows:
       if non_empty_row := row.strip():
         yield non_empty_row
 
   def _extract_filters(self) -> str:
-    if where_statement := re.search(
-      ' (WHERE|LIMIT|ORDER BY|PARAMETERS) .+',
-      self.expanded_query,
-      re.IGNORECASE,
-    ):
+    if where_statement := _FILTERS.search(self.expanded_query):
       return where_statement.group(0)
     return ''
 
@@ -349,7 +382,7 @@ class QuerySpecification(
     Returns:
       Parsed elements (field, alias, virtual_column).
     """
-    field, *alias = re.split(' [Aa][Ss] ', query_line)
+    field, *alias = _ALIAS.split(query_line)
     processed_field = self._process_field(field)
     field = processed_field.field
     if self._is_valid_google_ads_field(field):
@@ -385,30 +418,24 @@ class QuerySpecification(
     Returns:
         ProcessedField that contains formatted field with customizers.
     """
-    raw_field = raw_field.replace(r'\s+', '').strip()
+    raw_field = raw_field.strip()
     if self._is_quoted_string(raw_field):
       return ProcessedField(field=raw_field)
-    if len(resources := self._extract_resource_element(raw_field)) > 1:
-      field_name, resource_index = resources
-      return ProcessedField(
-        field=field_name,
-        customizer_type='resource_index',
-        customizer_value=int(resource_index),
-      )
-
-    if len(nested_fields := self._extract_nested_resource(raw_field)) > 1:
-      field_name, nested_field = nested_fields
-      return ProcessedField(
-        field=field_name,
-        customizer_type='nested_field',
-        customizer_value=nested_field,
-      )
-    if len(pointers := self._extract_pointer(raw_field)) > 1:
-      field_name, pointer = pointers
-      return ProcessedField(
-        field=field_name, customizer_type='pointer', customizer_value=pointer
-      )
-    return ProcessedField(field=raw_field)
+    if not (customizer := _CUSTOMIZER.fullmatch(raw_field)):
+      if _CUSTOMIZER_DELIMITER.search(raw_field):
+        raise exceptions.GaarfCustomizerException(
+          f'Malformed customizer in field: {raw_field}'
+        )
+      return ProcessedField(field=raw_field)
+    customizer_type = _CUSTOMIZER_TYPES[customizer.group('delimiter')]
+    customizer_value = customizer.group('value')
+    if customizer_type == 'resource_index':
+      customizer_value = int(customizer_value)
+    return ProcessedField(
+      field=customizer.group('field'),
+      customizer_type=customizer_type,
+      customizer_value=customizer_value,
+    )
 
   def _convert_to_virtual_column(self, field: str) -> VirtualColumn:
     """Converts a field to virtual column."""
@@ -420,8 +447,7 @@ class QuerySpecification(
     if isinstance(field, (int, float)):
       return VirtualColumn(type='built-in', value=field)
 
-    operators = ('/', r'\*', r'\+', ' - ')
-    if len(expressions := re.split('|'.join(operators), field)) > 1:
+    if len(expressions := _VIRTUAL_COLUMN_OPERATORS.split(field)) > 1:
       virtual_column_fields = []
       substitute_expression = field
       for expression in expressions:
@@ -441,7 +467,7 @@ class QuerySpecification(
       raise exceptions.GaarfFieldException(
         f"Incorrect field '{field}' in the query '{self.text}'."
       )
-    field = field.replace("'", '').replace('"', '')
+    field = field.translate(_REMOVE_QUOTES)
     field = field.format(**self.macros) if self.macros else field
     return VirtualColumn(type='built-in', value=field)
 
@@ -453,26 +479,17 @@ class QuerySpecification(
     except AttributeError:
       return False
 
-  def _extract_resource_element(self, line_elements: str) -> list[str]:
-    return re.split('~', line_elements)
-
-  def _extract_pointer(self, line_elements: str) -> list[str]:
-    return re.split('->', line_elements)
-
-  def _extract_nested_resource(self, line_elements: str) -> list[str]:
-    return re.split(':', line_elements)
-
   def _format_type_field_name(self, field_name: str) -> str:
-    return re.sub(r'\.type', '.type_', field_name)
+    return _TYPE_FIELD.sub('.type_', field_name)
 
   def _normalize_column_name(self, column_name: str) -> str:
-    return re.sub(r'\.', '_', column_name)
+    return column_name.translate(_DOTS_TO_UNDERSCORES)
 
   def _remove_trailing_comma(self, query: str) -> str:
-    return re.sub(r',\s+from', ' FROM', query, re.IGNORECASE)
+    return _TRAILING_COMMA.sub(' FROM', query)
 
   def _unformat_type_field_name(self, query: str) -> str:
-    return re.sub(r'\.type_', '.type', query)
+    return _FORMATTED_TYPE_FIELD.sub('.type', query)
 
   def _is_quoted_string(self, field_name: str) -> bool:
     if (field_name.startswith("'") and field_name.endswith("'")) or (
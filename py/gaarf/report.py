@@ -26,6 +26,7 @@ from __future__ import annotations
 
 import itertools
 import json
+import operator
 import warnings
 from collections import defaultdict
 from collections.abc import MutableSequence, Sequence
@@ -384,15 +385,12 @@ class GaarfReport:
     if isinstance(key, str):
       key = [key]
     if set(key).issubset(set(self.column_names)):
-      indices = []
-      for k in key:
-        indices.append(self.column_names.index(k))
-      results = []
-      for row in self.results:
-        rows = []
-        for index in indices:
-          rows.append(row[index])
-        results.append(rows)
+      indices = [self.column_names.index(k) for k in key]
+      getter = operator.itemgetter(*indices)
+      if len(indices) == 1:
+        results = [[getter(row)] for row in self.results]
+      else:
+        results = [list(getter(row)) for row in self.results]
       # TODO: propagate placeholders and query specification to new report
       return GaarfReport(results, key)
     non_existing_keys = set(key).intersection(set(self.column_names))
@@ -407,16 +405,26 @@ class GaarfReport:
     raise exceptions.GaarfReportException(message)
 
   def __eq__(self, other) -> bool:
+    if self is other:
+      return True
     if not isinstance(other, self.__class__):
       return False
-    if sorted(self.column_names) != sorted(other.column_names):
-      return False
     if len(self.results) != len(other.results):
       return False
-    for self_row, other_row in zip(self, other):
-      if self_row.to_dict() != other_row.to_dict():
-        return False
-    return True
+    if self.column_names == other.column_names:
+      return all(
+        self_row == other_row or list(self_row) == list(other_row)
+        for self_row, other_row in zip(self.results, other.results)
+      )
+    if sorted(self.column_names) != sorted(other.column_names):
+      return False
+    getter = operator.itemgetter(
+      *[other.column_names.index(name) for name in self.column_names]
+    )
+    return all(
+      list(self_row) == list(getter(other_row))
+      for self_row, other_row in zip(self.results, other.results)
+    )
 
   def __add__(self, other: GaarfReport) -> GaarfReport:
     """Combines two reports into one.
@@ -480,6 +488,8 @@ class GaarfRow:
       column_names: ...
   """
 
+  __slots__ = ('data', 'column_names')
+
   def __init__(
     self, data: parsers.GoogleAdsRowElement, column_names: Sequence[str]
   ) -> None:
@@ -537,15 +547,18 @@ class GaarfRow:
     Raises:
         GaarfReportException: If element not found in the position.
     """
-    if isinstance(element, int):
-      if element < len(self.column_names):
-        return self.data[element]
+    try:
+      return self.data[element]
+    except IndexError as e:
       raise exceptions.GaarfReportException(
         f'cannot find data in position {element}!'
-      )
-    if isinstance(element, str):
-      return self.__getattr__(element)
-    raise exceptions.GaarfReportException(f'cannot find {element} element!')
+      ) from e
+    except TypeError as e:
+      if isinstance(element, str):
+        return self.__getattr__(element)
+      raise exceptions.GaarfReportException(
+        f'cannot find {element} element!'
+      ) from e
 
   def __setattr__(self, name: str, value: parsers.GoogleAdsRowElement) -> None:
     """Sets new value for an attribute.
@@ -21,13 +21,14 @@ AdsReportFetcher performs fetching data from Ads API, parsing it
 from __future__ import annotations
 
 import enum
+import functools
 import importlib
 import itertools
 import logging
 import warnings
 from collections.abc import MutableSequence, Sequence
 from concurrent import futures
-from typing import Any, Generator
+from typing import Any
 
 from google.ads.googleads import client as googleads_client
 from google.ads.googleads import errors as googleads_exceptions
@@ -123,6 +124,7 @@ class AdsReportFetcher:
     expand_mcc: bool = False,
     args: dict[str, Any] | None = None,
     optimize_strategy: str = 'NONE',
+    max_customer_concurrency: int | None = None,
   ) -> report.GaarfReport:
     """Asynchronously fetches data from Ads API based on query_specification.
 
@@ -136,6 +138,8 @@ class AdsReportFetcher:
         args: Arguments that need to be passed to the query.
         optimize_strategy: strategy for speeding up query execution
             ("NONE", "PROTOBUF", "BATCH", "BATCH_PROTOBUF").
+        max_customer_concurrency: Maximum number of accounts fetched
+            concurrently; accounts are fetched one by one if not set.
 
     Returns:
         GaarfReport with results of query execution.
@@ -147,6 +151,7 @@ class AdsReportFetcher:
       expand_mcc,
       args,
       optimize_strategy,
+      max_customer_concurrency,
     )
 
   def fetch(
@@ -157,6 +162,7 @@ class AdsReportFetcher:
     expand_mcc: bool = False,
     args: dict[str, Any] | None = None,
     optimize_strategy: str = 'NONE',
+    max_customer_concurrency: int | None = None,
   ) -> report.GaarfReport:
     """Fetches data from Ads API based on query_specification.
 
@@ -170,16 +176,24 @@ class AdsReportFetcher:
         args: Arguments that need to be passed to the query.
         optimize_strategy: strategy for speeding up query execution
             ("NONE", "PROTOBUF", "BATCH", "BATCH_PROTOBUF").
+        max_customer_concurrency: Maximum number of accounts fetched
+            concurrently; accounts are fetched one by one if not set.
 
     Returns:
         GaarfReport with results of query execution.
 
     Raises:
         GaarfExecutorException:
-            When customer_ids are not provided or Ads API returned error.
+            When customer_ids are not provided, max_customer_concurrency
+            is not positive or Ads API returned error.
         GaarfBuiltInQueryException:
             When built-in query cannot be found in the registry.
     """
+    if max_customer_concurrency is not None and max_customer_concurrency < 1:
+      raise exceptions.GaarfExecutorException(
+        'max_customer_concurrency should be a positive number, '
+        f'got {max_customer_concurrency}'
+      )
     if isinstance(self.api_client, api_clients.GoogleAdsApiClient):
       if not customer_ids:
         warnings.warn(
@@ -223,28 +237,36 @@ class AdsReportFetcher:
       return builtin_report(self, accounts=customer_ids)
     optimize_strategy = OptimizeStrategy[optimize_strategy]
     parser = parsers.GoogleAdsRowParser(query_specification)
-    for customer_id in customer_ids:
-      logger.debug(
-        'Running query %s for customer_id %s',
-        query_specification.query_title,
-        customer_id,
-      )
-      try:
-        results = self._parse_ads_response(
-          query_specification, customer_id, parser, optimize_strategy
-        )
-        total_results.extend(results)
-        if query_specification.is_constant_resource:
-          logger.debug('Constant resource query: running only once')
-          break
-      except googleads_exceptions.GoogleAdsException as e:
-        logger.error(
-          'Cannot execute query %s for %s',
-          query_specification.query_title,
-          customer_id,
+    fetch_customer = functools.partial(
+      self._fetch_customer,
+      query_specification,
+      parser=parser,
+      optimize_strategy=optimize_strategy,
+    )
+    if query_specification.is_constant_resource and customer_ids:
+      logger.debug('Constant resource query: running only once')
+      customer_ids = customer_ids[:1]
+    if max_customer_concurrency and len(customer_ids) > 1:
+      with futures.ThreadPoolExecutor(
+        max_workers=max_customer_concurrency
+      ) as executor:
+        customer_futures = [
+          executor.submit(fetch_customer, customer_id)
+          for customer_id in customer_ids
+        ]
+        done, pending = futures.wait(
+          customer_futures, return_when=futures.FIRST_EXCEPTION
         )
-        logger.error(str(e))
-        raise exceptions.GaarfExecutorException(e.error)
+        for future in done:
+          if future.exception():
+            for pending_future in pending:
+              pending_future.cancel()
+            future.result()
+        for future in customer_futures:
+          total_results.extend(future.result())
+    else:
+      for customer_id in customer_ids:
+        total_results.extend(fetch_customer(customer_id))
     if not total_results:
       results_placeholder = [
         parser.parse_ads_row(self.api_client.google_ads_row)
@@ -264,6 +286,52 @@ class AdsReportFetcher:
       query_specification=query_specification,
     )
 
+  def _fetch_customer(
+    self,
+    query_specification: query_editor.QueryElements,
+    customer_id: str,
+    parser: parsers.GoogleAdsRowParser,
+    optimize_strategy: OptimizeStrategy = OptimizeStrategy.NONE,
+  ) -> list[list[tuple]]:
+    """Fetches and parses data from Ads API for a single account.
+
+    Args:
+        query_specification:
+            Query text that will be passed to Ads API
+            alongside column_names, customizers and virtual columns.
+        customer_id:
+            Account for which data should be requested.
+        parser:
+            An instance of parser class that transforms each row from
+            request into desired format.
+        optimize_strategy:
+            Strategy for speeding up query execution
+            ("NONE", "PROTOBUF", "BATCH", "BATCH_PROTOBUF").
+
+    Returns:
+        Parsed rows for the account.
+
+    Raises:
+        GaarfExecutorException: When Ads API returned error.
+    """
+    logger.debug(
+      'Running query %s for customer_id %s',
+      query_specification.query_title,
+      customer_id,
+    )
+    try:
+      return self._parse_ads_response(
+        query_specification, customer_id, parser, optimize_strategy
+      )
+    except googleads_exceptions.GoogleAdsException as e:
+      logger.error(
+        'Cannot execute query %s for %s',
+        query_specification.query_title,
+        customer_id,
+      )
+      logger.error(str(e))
+      raise exceptions.GaarfExecutorException(e.error)
+
   def _parse_ads_response(
     self,
     query_specification: query_editor.QueryElements,
@@ -304,7 +372,7 @@ class AdsReportFetcher:
         query_text=query_specification.query_text,
       )
     except google_exceptions.InternalServerError:
-      logging.error(
+      logger.error(
         'Cannot fetch data from API for query "%s" 3 times',
         query_specification.query_title,
       )
@@ -355,22 +423,18 @@ class AdsReportFetcher:
     """
     parsed_batches: list[list[parsers.GoogleAdsRowElement]] = []
     with futures.ThreadPoolExecutor() as executor:
-      future_to_batch = {}
-      for batch in response:
-        future_to_batch[
-          executor.submit(self._parse_batch, parser, batch.results)
-        ] = batch.results
-      for i, future in enumerate(
-        futures.as_completed(future_to_batch), start=1
-      ):
+      batch_futures = [
+        executor.submit(self._parse_batch, parser, batch.results)
+        for batch in response
+      ]
+      for i, future in enumerate(batch_futures, start=1):
+        parsed_batches.append(future.result())
         logger.debug(
           'Parsed batch %d for query %s for customer_id %s',
           i,
           query_specification.query_title,
           customer_id,
         )
-        parsed_batch = future.result()
-        parsed_batches.append(parsed_batch)
     return list(itertools.chain.from_iterable(parsed_batches))
 
   def _parse_ads_response_sequentially(
@@ -397,7 +461,8 @@ class AdsReportFetcher:
         Parsed rows for the whole response.
     """
     query_resource_consumption = 0
-    total_results: list[list[parsers.GoogleAdsRowElement]] = []
+    total_rows = 0
+    parsed_batches: list[list[list[parsers.GoogleAdsRowElement]]] = []
     logger.debug(
       'Iterating over response for query %s for customer_id %s',
       query_specification.query_title,
@@ -412,20 +477,30 @@ class AdsReportFetcher:
       )
 
       results = self._parse_batch(parser, batch.results)
-      total_results.extend(list(results))
-    logging.debug(
-      'query resource consumption for query [%s] for account [%s]: %d',
+      parsed_batches.append(results)
+      total_rows += len(results)
+      logger.debug(
+        'Parsed %d rows (%d in total) for query %s for customer_id %s',
+        len(results),
+        total_rows,
+        query_specification.query_title,
+        customer_id,
+      )
+    logger.debug(
+      'query resource consumption for query [%s] for account [%s]: %d, '
+      'rows: %d',
       query_specification.query_title,
       customer_id,
       query_resource_consumption,
+      total_rows,
     )
-    return total_results
+    return list(itertools.chain.from_iterable(parsed_batches))
 
   def _parse_batch(
     self,
     parser: parsers.GoogleAdsRowParser,
     batch: Sequence[google_ads_service.GoogleAdsRow],
-  ) -> Generator[list, None, None]:
+  ) -> list[list[parsers.GoogleAdsRowElement]]:
     """Parse reach row from batch of Ads API response.
 
     Args:
@@ -435,11 +510,10 @@ class AdsReportFetcher:
         batch:
             Sequence of GoogleAdsRow that needs to be parsed.
 
-    Yields:
+    Returns:
         Parsed rows for a batch.
     """
-    for row in batch:
-      yield parser.parse_ads_row(row)
+    return parser.parse_ads_rows(batch)
 
   def _get_customer_ids(
     self,
@@ -473,12 +547,8 @@ class AdsReportFetcher:
       query_specification = query_editor.QuerySpecification(
         customer_ids_query
       ).generate()
-      child_customer_ids = self.fetch(query_specification, child_customer_ids)
       child_customer_ids = [
-        row[0] if isinstance(row, report.GaarfRow) else row
-        for row in child_customer_ids
+        row[0]
+        for row in self.fetch(query_specification, child_customer_ids).results
       ]
-
-    return list(
-      {customer_id for customer_id in child_customer_ids if customer_id != 0}
-    )
+    return list(set(child_customer_ids) - {0})
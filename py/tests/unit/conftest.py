@@ -17,7 +17,7 @@ import pathlib
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def config_path() -> pathlib.Path:
   return (
     pathlib.Path(__file__).parent / '../end-to-end/data/test-google-ads.yaml'
@@ -79,3 +79,6 @@ class TestAdsQueryExecutor:
       result = json.load(f)
 
     assert result == expected_result
+
+  def test_report_fetcher_is_created_once(self, executor):
+    assert executor.report_fetcher is executor.report_fetcher
@@ -45,14 +45,14 @@ class FakeBatch:
   query_resource_consumption: int = 0
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Customer:
   """Helper to represent customer resource."""
 
   id: int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class FakeGoogleAdsRowElement:
   """Helper to represent a single row in the batch."""
 
@@ -84,6 +84,33 @@ class TestFormatterWithoutPlaceholders:
     )
     assert expected_report == formatted_report
 
+  def test_iter_formatted_rows_converts_arrays_to_strings(
+    self, report_with_arrays
+  ):
+    array_handling_strategy = formatter.ArrayHandlingStrategy(type_='strings')
+    formatted_rows = array_handling_strategy.iter_formatted_rows(
+      report_with_arrays.results
+    )
+    assert list(formatted_rows) == [
+      [1, '2'],
+      [2, '3'],
+      [3, '4|5'],
+    ]
+
+  def test_iter_formatted_rows_keeps_missing_values_in_array_columns(self):
+    array_handling_strategy = formatter.ArrayHandlingStrategy(type_='strings')
+    formatted_rows = array_handling_strategy.iter_formatted_rows(
+      [[1, [2, 3]], [2, None]]
+    )
+    assert list(formatted_rows) == [[1, '2|3'], [2, None]]
+
+  def test_iter_formatted_rows_converts_arrays_after_missing_values(self):
+    array_handling_strategy = formatter.ArrayHandlingStrategy(type_='strings')
+    formatted_rows = array_handling_strategy.iter_formatted_rows(
+      [[1, None], [2, [3, 4]]]
+    )
+    assert list(formatted_rows) == [[1, None], [2, '3|4']]
+
 
 class TestFormatterWithPlaceholders:
   @pytest.fixture
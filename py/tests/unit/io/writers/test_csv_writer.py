@@ -35,9 +35,7 @@ class TestCsvWriter:
     output = output_folder / _TMP_FILENAME
     expected = ['column_1', '1', '2', '3']
     csv_writer.write(single_column_data, _TMP_FILENAME)
-    with open(output, 'r') as f:
-      file = f.readlines()
-    assert [row.strip() for row in file] == expected
+    assert output.read_text().splitlines() == expected
 
   def test_write_multi_column_report_returns_correct_data(
     self, csv_writer, sample_data, output_folder
@@ -49,9 +47,7 @@ class TestCsvWriter:
     ]
     csv_writer.array_handling = 'arrays'
     csv_writer.write(sample_data, _TMP_FILENAME)
-    with open(output, 'r') as f:
-      file = f.readlines()
-    assert [row.strip() for row in file] == expected
+    assert output.read_text().splitlines() == expected
 
   def test_write_multi_column_report_with_arrays_returns_correct_data(
     self, csv_writer, sample_data, output_folder
@@ -63,6 +59,4 @@ class TestCsvWriter:
     ]
     csv_writer.array_handling = 'strings'
     csv_writer.write(sample_data, _TMP_FILENAME)
-    with open(output, 'r') as f:
-      file = f.readlines()
-    assert [row.strip() for row in file] == expected
+    assert output.read_text().splitlines() == expected
@@ -342,6 +342,32 @@ class TestGoogleAdsRowParser:
       'APPROVED',
     ]
 
+  def test_parse_ads_rows_returns_parsed_row_for_each_row(
+    self, google_ads_row_parser, fake_ads_row
+  ):
+    expected_row = [
+      'SEARCH',
+      1,
+      2,
+      1,
+      'nested_value',
+      1,
+      ['LIMITED'],
+      'APPROVED',
+    ]
+    assert google_ads_row_parser.parse_ads_rows(
+      [fake_ads_row, fake_ads_row]
+    ) == [expected_row, expected_row]
+
+  def test_parse_element_skips_parsers_chain_for_scalars(
+    self, mocker, google_ads_row_parser
+  ):
+    parse = mocker.spy(google_ads_row_parser.parser_chain, 'parse')
+
+    assert google_ads_row_parser._parse_element(1) == 1
+    assert google_ads_row_parser._parse_element(['a', None]) == ['a', None]
+    parse.assert_not_called()
+
   def test_parse_ads_row_extracts_correct_resource_indices_from_array(
     self,
     google_ads_row_parser,
@@ -231,6 +231,44 @@ class TestRegularQuery:
     with pytest.raises(exceptions.GaarfFieldException):
       spec.generate()
 
+  @pytest.mark.parametrize('from_statement', ['from', 'FROM', 'From'])
+  def test_generate_removes_trailing_comma_before_from_in_any_case(
+    self, from_statement
+  ):
+    query = f'SELECT campaign.id AS campaign_id, {from_statement} campaign'
+    spec = query_editor.QuerySpecification(
+      title='sample_query', text=query, args=None
+    ).generate()
+
+    assert spec.query_text == 'SELECT campaign.id FROM campaign'
+
+  @pytest.mark.parametrize(
+    'field',
+    [
+      'campaign.id:nested:value',
+      'campaign.id:nested~1',
+      'campaign.id~1~2',
+      'campaign.id->',
+    ],
+  )
+  def test_malformed_customizer_raises_customizer_error(self, field):
+    query = f'SELECT {field} AS campaign FROM campaign'
+    spec = query_editor.QuerySpecification(
+      title='sample_query', text=query, args=None
+    )
+    with pytest.raises(exceptions.GaarfCustomizerException):
+      spec.generate()
+
+  def test_generate_expands_query_only_once(self, mocker):
+    query = 'SELECT metrics.clicks AS clicks FROM ad_group'
+    spec = query_editor.QuerySpecification(
+      title='sample_query', text=query, args=None
+    )
+    expand_jinja = mocker.spy(spec, 'expand_jinja')
+    spec.generate()
+
+    expand_jinja.assert_called_once()
+
 
 class TestTemplatedQuery:
   def test_extract_correct_fields(self, templated_query):
@@ -15,7 +15,6 @@ from __future__ import annotations
 
 from collections import abc
 
-import pandas as pd
 import pytest
 
 from gaarf import exceptions, report
@@ -85,28 +84,20 @@ class TestGaarfReport:
       multi_column_report,
     ):
       with pytest.raises(exceptions.GaarfReportException):
-        [row[99] for row in multi_column_report] == [1, 2, 3]
+        multi_column_report[0][99]
 
     def test_get_raises_attribute_error_for_missing_value(
       self, multi_column_report
     ):
       with pytest.raises(AttributeError):
-        [row.get('missing_value') for row in multi_column_report] == [
-          None,
-          None,
-          None,
-        ]
+        multi_column_report[0].get('missing_value')
 
     def test_getattr_raises_attribute_error_for_missing_value(
       self,
       multi_column_report,
     ):
       with pytest.raises(AttributeError):
-        [getattr(row, 'missing_value') for row in multi_column_report] == [
-          None,
-          None,
-          None,
-        ]
+        getattr(multi_column_report[0], 'missing_value')
 
     def test_hasattr_return_false_for_missing_value(self, multi_column_report):
       assert [hasattr(row, 'missing_value') for row in multi_column_report] == [
@@ -215,17 +206,19 @@ class TestGaarfReport:
       added_report = multi_column_report + multi_column_report
       assert len(added_report) == len(multi_column_report.results) * 2
 
+    @pytest.mark.parametrize(
+      ('add_operation', 'expected_exception'),
+      [
+        (lambda report: report + 1, exceptions.GaarfReportException),
+        (lambda report: 1 + report, TypeError),
+      ],
+      ids=['report_and_non_report', 'non_report_and_report'],
+    )
     def test_add_report_and_non_report_raises_exception(
-      self, multi_column_report
+      self, multi_column_report, add_operation, expected_exception
     ):
-      with pytest.raises(exceptions.GaarfReportException):
-        multi_column_report + 1
-
-    def test_add_non_report_and_report_raises_exception(
-      self, multi_column_report
-    ):
-      with pytest.raises(TypeError):
-        1 + multi_column_report
+      with pytest.raises(expected_exception):
+        add_operation(multi_column_report)
 
     def test_add_reports_with_different_columns_raises_exception(
       self, multi_column_report, single_element_report
@@ -252,15 +245,6 @@ class TestGaarfReport:
         data=[1, 2], column_names=['campaign_id', 'ad_group_id']
       )
 
-    def test_indexing_multi_column_gaarf_report_by_multi_index_returns_gaarf_report(
-      self,
-      multi_column_report,
-    ):
-      new_report = multi_column_report[0:2]
-      assert new_report == report.GaarfReport(
-        results=[[1, 2], [2, 3]], column_names=['campaign_id', 'ad_group_id']
-      )
-
     def test_indexing_multi_column_gaarf_report_by_one_column_returns_gaarf_report(
       self,
       multi_column_report,
@@ -475,6 +459,7 @@ class TestGaarfReport:
     def test_conversion_from_pandas(
       self,
     ):
+      pd = pytest.importorskip('pandas')
       values = [[1, 2], [3, 4]]
       column_names = ['one', 'two']
       df = pd.DataFrame(data=values, columns=column_names)
@@ -485,6 +470,7 @@ class TestGaarfReport:
       assert report_from_df == expected_report
 
     def test_convert_report_to_pandas(self, multi_column_report):
+      pd = pytest.importorskip('pandas')
       expected = pd.DataFrame(
         data=[[1, 2], [2, 3], [3, 4]], columns=['campaign_id', 'ad_group_id']
       )
@@ -529,16 +515,21 @@ class TestGaarfReport:
       self, multi_column_report
     ):
       new_multi_column_report = report.GaarfReport(
-        results=list(multi_column_report.results),
-        column_names=list(multi_column_report.column_names),
+        results=multi_column_report.results[:],
+        column_names=multi_column_report.column_names[:],
       )
       new_multi_column_report.results[0] = [10, 10]
       assert new_multi_column_report != multi_column_report
 
+    def test_report_with_different_number_of_rows_are_not_equal(
+      self, multi_column_report
+    ):
+      assert multi_column_report[0:2] != multi_column_report
+
     def test_report_with_same_data_are_equal(self, multi_column_report):
       new_multi_column_report = report.GaarfReport(
-        results=list(multi_column_report.results),
-        column_names=list(multi_column_report.column_names),
+        results=multi_column_report.results[:],
+        column_names=multi_column_report.column_names[:],
       )
       assert new_multi_column_report == multi_column_report
 
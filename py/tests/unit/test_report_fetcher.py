@@ -12,6 +12,7 @@
 # limitations under the License.
 from __future__ import annotations
 
+import collections
 import itertools
 import logging
 
@@ -38,30 +39,45 @@ _EXPECTED_RESULTS = [
 ]
 
 
-class TestAdsReportFetcher:
-  @pytest.fixture
-  def fake_response(self):
-    fake_results = [
-      [
-        helpers.FakeGoogleAdsRowElement(helpers.Customer(1)),
-      ],
-      [
-        helpers.FakeGoogleAdsRowElement(helpers.Customer(2)),
-      ],
-      [
-        helpers.FakeGoogleAdsRowElement(helpers.Customer(3)),
-      ],
-    ]
-    return helpers.FakeResponse(data=fake_results)
+@pytest.fixture(autouse=True, scope='module')
+def _patch_oauth2(module_mocker):
+  module_mocker.patch('google.ads.googleads.client.oauth2', return_value=[])
 
-  @pytest.fixture
-  def test_client(self, mocker, config_path):
-    mocker.patch('google.ads.googleads.client.oauth2', return_value=[])
-    return api_clients.GoogleAdsApiClient(path_to_config=config_path)
 
+@pytest.fixture(scope='module')
+def query_specification():
+  return query_editor.QuerySpecification(_QUERY).generate()
+
+
+@pytest.fixture(scope='module')
+def parser(query_specification):
+  return parsers.GoogleAdsRowParser(query_specification)
+
+
+@pytest.fixture(scope='class')
+def fake_response():
+  fake_results = [
+    [
+      helpers.FakeGoogleAdsRowElement(helpers.Customer(1)),
+    ],
+    [
+      helpers.FakeGoogleAdsRowElement(helpers.Customer(2)),
+    ],
+    [
+      helpers.FakeGoogleAdsRowElement(helpers.Customer(3)),
+    ],
+  ]
+  return helpers.FakeResponse(data=fake_results)
+
+
+@pytest.fixture(scope='class')
+def test_client(config_path):
+  return api_clients.GoogleAdsApiClient(path_to_config=config_path)
+
+
+class TestAdsReportFetcher:
   @pytest.fixture
   def failing_api_client(self, mocker, config_path):
-    mocker.patch('google.ads.googleads.client.oauth2', return_value=[])
     mocker.patch(
       f'google.ads.googleads.{api_clients.GOOGLE_ADS_API_VERSION}'
       '.services.services.google_ads_service.GoogleAdsServiceClient'
@@ -85,11 +101,9 @@ class TestAdsReportFetcher:
     return report_fetcher.AdsReportFetcher(test_client)
 
   def test_parse_ads_response_returns_success(
-    self, fake_report_fetcher, caplog
+    self, fake_report_fetcher, query_specification, parser, caplog
   ):
     caplog.set_level(logging.DEBUG)
-    query_specification = query_editor.QuerySpecification(_QUERY).generate()
-    parser = parsers.GoogleAdsRowParser(query_specification)
     customer_id = 1
     results = fake_report_fetcher._parse_ads_response(
       query_specification=query_specification,
@@ -108,10 +122,8 @@ class TestAdsReportFetcher:
     ],
   )
   def test_parse_ads_response_in_batches_generates_warning_messages(
-    self, fake_report_fetcher, strategy, caplog
+    self, fake_report_fetcher, query_specification, parser, strategy, caplog
   ):
-    query_specification = query_editor.QuerySpecification(_QUERY).generate()
-    parser = parsers.GoogleAdsRowParser(query_specification)
     customer_id = 1
     optimize_strategy = report_fetcher.OptimizeStrategy[strategy]
     fake_report_fetcher._parse_ads_response(
@@ -134,6 +146,83 @@ class TestAdsReportFetcher:
 
     assert fetched_report == expected_report
 
+  def test_fetch_with_max_customer_concurrency_returns_results_for_all_customers(  # noqa: E501
+    self, fake_report_fetcher
+  ):
+    fetched_report = fake_report_fetcher.fetch(
+      query_specification=_QUERY,
+      customer_ids=[1, 2],
+      max_customer_concurrency=2,
+    )
+    expected_report = report.GaarfReport(
+      results=_EXPECTED_RESULTS + _EXPECTED_RESULTS,
+      column_names=['customer_id'],
+    )
+
+    assert fetched_report == expected_report
+
+  def test_fetch_with_non_positive_max_customer_concurrency_raises_gaarf_exception(  # noqa: E501
+    self, fake_report_fetcher
+  ):
+    with pytest.raises(
+      exceptions.GaarfExecutorException, match='max_customer_concurrency'
+    ):
+      fake_report_fetcher.fetch(
+        query_specification=_QUERY,
+        customer_ids=[1, 2],
+        max_customer_concurrency=-1,
+      )
+
+  def test_fetch_with_max_customer_concurrency_raises_gaarf_exception(
+    self, mocker, fake_report_fetcher
+  ):
+    mocker.patch.object(
+      fake_report_fetcher,
+      '_parse_ads_response',
+      side_effect=googleads_exceptions.GoogleAdsException(
+        'test-error', 'test-call', 'test-failure', 'test-request-id'
+      ),
+    )
+    with pytest.raises(exceptions.GaarfExecutorException, match='test-error'):
+      fake_report_fetcher.fetch(
+        query_specification=_QUERY,
+        customer_ids=[1, 2, 3],
+        max_customer_concurrency=2,
+      )
+
+  def test_fetch_runs_constant_resource_query_only_once(
+    self, mocker, fake_report_fetcher
+  ):
+    parse_ads_response = mocker.patch.object(
+      fake_report_fetcher, '_parse_ads_response', return_value=[[1]]
+    )
+    fake_report_fetcher.fetch(
+      query_specification=(
+        'SELECT language_constant.id AS language_id FROM language_constant'
+      ),
+      customer_ids=[1, 2, 3],
+      max_customer_concurrency=3,
+    )
+
+    parse_ads_response.assert_called_once()
+
+  def test_expand_mcc_returns_accounts_matching_customer_ids_query(
+    self, mocker, fake_report_fetcher
+  ):
+    mocker.patch.object(
+      fake_report_fetcher,
+      'fetch',
+      side_effect=[
+        report.GaarfReport(
+          results=[[1], [2], [0]], column_names=['customer_id']
+        ),
+        report.GaarfReport(results=[[2]], column_names=['customer_id']),
+      ],
+    )
+    customer_ids = fake_report_fetcher.expand_mcc('1', _QUERY)
+
+    assert customer_ids == [2]
+
   def test_fetch_raises_gaarf_exception(self, mocker, fake_report_fetcher):
     mocker.patch(
       'gaarf.report_fetcher.AdsReportFetcher._parse_ads_response',
@@ -147,10 +236,8 @@ class TestAdsReportFetcher:
       fake_report_fetcher.fetch(query_specification=_QUERY, customer_ids=[1])
 
   def test_parse_ads_response_sequentially_returns_success(
-    self, fake_report_fetcher, fake_response
+    self, fake_report_fetcher, fake_response, query_specification, parser
   ):
-    query_specification = query_editor.QuerySpecification(_QUERY).generate()
-    parser = parsers.GoogleAdsRowParser(query_specification)
     customer_id = 1
     results = fake_report_fetcher._parse_ads_response_sequentially(
       response=fake_response,
@@ -162,10 +249,8 @@ class TestAdsReportFetcher:
     assert results == _EXPECTED_RESULTS
 
   def test_parse_ads_response_in_batches_returns_success(
-    self, fake_report_fetcher, fake_response
+    self, fake_report_fetcher, fake_response, query_specification, parser
   ):
-    query_specification = query_editor.QuerySpecification(_QUERY).generate()
-    parser = parsers.GoogleAdsRowParser(query_specification)
     customer_id = 1
     results = fake_report_fetcher._parse_ads_response_in_batches(
       response=fake_response,
@@ -174,14 +259,12 @@ class TestAdsReportFetcher:
       customer_id=customer_id,
     )
 
-    assert_sequence_content_the_same(results, _EXPECTED_RESULTS)
+    assert assert_sequence_content_the_same(results, _EXPECTED_RESULTS)
 
   def test_parse_ads_response_raises_internal_server_error_after_3_failed_attemps(  # noqa: E501
-    self, failing_api_client, caplog
+    self, failing_api_client, query_specification, parser, caplog
   ):
     fetcher = report_fetcher.AdsReportFetcher(failing_api_client)
-    query_specification = query_editor.QuerySpecification(_QUERY).generate()
-    parser = parsers.GoogleAdsRowParser(query_specification)
     customer_id = 1
     with pytest.raises(google_exceptions.InternalServerError):
       fetcher._parse_ads_response(
@@ -199,6 +282,6 @@ def assert_sequence_content_the_same(
   results: list[list[parsers.GoogleAdsRowElement]],
   other_results: list[list[parsers.GoogleAdsRowElement]],
 ) -> bool:
-  return sorted(itertools.chain.from_iterable(results)) == sorted(
-    itertools.chain.from_iterable(other_results)
-  )
+  return collections.Counter(
+    itertools.chain.from_iterable(results)
+  ) == collections.Counter(itertools.chain.from_iterable(other_results))
@@ -7,7 +7,7 @@ from gaarf.query_editor import QuerySpecification
 from gaarf.simulation import SimulatorSpecification, simulate_data
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def query():
   return """
         SELECT
@@ -24,25 +24,28 @@ def query():
         """
 
 
-class TestDefaultSimulation:
-  @pytest.fixture
-  def query_specification(self, query):
-    return QuerySpecification(query).generate()
+@pytest.fixture(scope='class')
+def query_specification(query):
+  return QuerySpecification(query).generate()
 
-  @pytest.fixture
-  def default_simulator_specification(self):
-    return SimulatorSpecification(n_rows=3)
 
-  @pytest.fixture
-  def default_report(self, query, default_simulator_specification):
-    return simulate_data(
-      query_text=query,
-      query_name='test',
-      args=None,
-      api_version=GOOGLE_ADS_API_VERSION,
-      simulator_specification=default_simulator_specification,
-    )
+@pytest.fixture(scope='class')
+def default_simulator_specification():
+  return SimulatorSpecification(n_rows=3)
 
+
+@pytest.fixture(scope='class')
+def default_report(query, default_simulator_specification):
+  return simulate_data(
+    query_text=query,
+    query_name='test',
+    args=None,
+    api_version=GOOGLE_ADS_API_VERSION,
+    simulator_specification=default_simulator_specification,
+  )
+
+
+class TestDefaultSimulation:
   def test_simulate_data_returns_same_n_rows_as_in_simulation_specification(
     self, default_report, default_simulator_specification
   ):
@@ -84,32 +87,36 @@ class TestDefaultSimulation:
     assert 0 <= default_report[0].conversions <= 1000
 
 
-class TestCustomSimulation:
-  @pytest.fixture
-  def allowed_enums(self):
-    return ['APP_CAMPAIGN', 'APP_CAMPAIGN_FOR_ENGAGEMENT']
-
-  @pytest.fixture
-  def replacements(self):
-    return {'asset.youtube_video_asset.youtube_video_id': ['12345', '54321']}
-
-  @pytest.fixture
-  def custom_simulator_specification(self, allowed_enums, replacements):
-    return SimulatorSpecification(
-      allowed_enums={'campaign.advertising_channel_sub_type': allowed_enums},
-      replacements=replacements,
-    )
+@pytest.fixture(scope='class')
+def allowed_enums():
+  return ['APP_CAMPAIGN', 'APP_CAMPAIGN_FOR_ENGAGEMENT']
 
-  @pytest.fixture
-  def custom_report(self, query, custom_simulator_specification):
-    return simulate_data(
-      query_text=query,
-      query_name='test',
-      args=None,
-      api_version=GOOGLE_ADS_API_VERSION,
-      simulator_specification=custom_simulator_specification,
-    )
 
+@pytest.fixture(scope='class')
+def replacements():
+  return {'asset.youtube_video_asset.youtube_video_id': ['12345', '54321']}
+
+
+@pytest.fixture(scope='class')
+def custom_simulator_specification(allowed_enums, replacements):
+  return SimulatorSpecification(
+    allowed_enums={'campaign.advertising_channel_sub_type': allowed_enums},
+    replacements=replacements,
+  )
+
+
+@pytest.fixture(scope='class')
+def custom_report(query, custom_simulator_specification):
+  return simulate_data(
+    query_text=query,
+    query_name='test',
+    args=None,
+    api_version=GOOGLE_ADS_API_VERSION,
+    simulator_specification=custom_simulator_specification,
+  )
+
+
+class TestCustomSimulation:
   def test_simulate_data_returns_only_allowed_enums(
     self, custom_report, custom_simulator_specification, allowed_enums
   ):
@@ -31,16 +31,20 @@ class FakeGoogleAdsRowElement:
   customer_client: CustomerClient
 
 
-@pytest.fixture
-def test_client(mocker, config_path):
+@pytest.fixture(autouse=True, scope='module')
+def _patch_oauth2(module_mocker):
+  module_mocker.patch('google.ads.googleads.client.oauth2', return_value=[])
+
+
+@pytest.fixture(scope='module')
+def test_client(module_mocker, config_path):
   fake_results = [
     [
       FakeGoogleAdsRowElement(CustomerClient(1)),
     ],
   ]
   fake_response = helpers.FakeResponse(data=fake_results)
-  mocker.patch('google.ads.googleads.client.oauth2', return_value=[])
-  mocker.patch(
+  module_mocker.patch(
     'gaarf.api_clients.GoogleAdsApiClient.get_response',
     return_value=fake_response,
   )